@@ -1,5 +1,5 @@
-from fastapi import APIRouter, HTTPException
-from app.models.generic_responses import Message
+from fastapi import APIRouter, HTTPException, Response
+from app.models.generic_responses import NOT_FOUND_RESPONSES
 from models.abend import AbendItem
 from api import tags
 from starlette import status
@@ -7,6 +7,17 @@ from starlette import status
 # Create the router
 router = APIRouter()
 
+# This is just example data, built once so lookups skip model validation
+_FIXTURES: dict[str, AbendItem] = {
+    "1": AbendItem(abendId="1", name="ABEND-001"),
+}
+
+# Pre-rendered bodies; FastAPI returns Response objects as-is, skipping
+# response_model validation and re-encoding on every hit
+_FIXTURE_RESPONSES: dict[str, Response] = {
+    abend_id: Response(content=item.model_dump_json(by_alias=True), media_type="application/json")
+    for abend_id, item in _FIXTURES.items()
+}
 
 
 @router.get(
@@ -14,21 +25,17 @@ router = APIRouter()
     summary="Get ABEND record by ID",
     description="Get a specific Abnormal End record by its ID.",
     response_model=AbendItem,
-    responses={status.HTTP_404_NOT_FOUND: {"model": Message}},
-    tags=[tags.INTERNAL_ABEND_V1ALPHA1.display_name]
+    responses=NOT_FOUND_RESPONSES,
+    tags=[tags.INTERNAL_ABEND_V1ALPHA1.name]
 )
 async def get_abend(abend_id: str):
     """
     Get a specific ABEND record by ID
     """
-    # This is just example data
-    if abend_id == "1":
-        return AbendItem(
-            abendId="1", 
-            name="ABEND-001"
-        )
-    else:
+    response = _FIXTURE_RESPONSES.get(abend_id)
+    if response is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ABEND record with ID {abend_id} not found",
         )
+    return response
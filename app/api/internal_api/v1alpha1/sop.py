@@ -11,7 +11,7 @@ router = APIRouter()
     summary="List all SOPs",
     description="List all Standard Operating Procedures available in the system.",
     response_model=list[SOPItem],
-    tags=[tags.INTERNAL_SOP_V1ALPHA1.display_name]
+    tags=[tags.INTERNAL_SOP_V1ALPHA1.name]
 )
 async def list_sops():
     """
@@ -1,14 +1,77 @@
-from fastapi import APIRouter
+import asyncio
+import time
+from typing import Optional, Tuple
+
+import orjson
+from fastapi import APIRouter, Response
 from pydantic import BaseModel
 from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
 
+from api import tags
+
 router = APIRouter()
 
+# Probe bursts within this window reuse the last verdict instead of
+# re-checking dependent services
+READYZ_CACHE_TTL_SECONDS = 2.0
+
 
 class ReadyzResult(BaseModel):
     message: str  # contains the reason for failure
 
 
+_READY_RESPONSE = Response(
+    content=orjson.dumps({"message": "OK"}),
+    media_type="application/json",
+)
+
+_cached_result: Optional[Tuple[float, Response]] = None
+# Created lazily and rebuilt per event loop: an asyncio.Lock is bound to the
+# loop it is first used on (e.g. a second TestClient runs a new loop)
+_cache_lock: Optional[asyncio.Lock] = None
+_cache_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _check_readiness() -> Response:
+    #  TODO: Add more detailed readiness check
+    # Check for all dependent services health, database connections, etc.
+    return _READY_RESPONSE
+
+
+def _get_cache_lock() -> asyncio.Lock:
+    """
+    Return the cache lock for the running event loop
+    """
+    global _cache_lock, _cache_lock_loop
+
+    loop = asyncio.get_running_loop()
+    if _cache_lock is None or _cache_lock_loop is not loop:
+        _cache_lock = asyncio.Lock()
+        _cache_lock_loop = loop
+    return _cache_lock
+
+
+async def _cached_check() -> Response:
+    """
+    Return the readiness verdict, running the real check at most once per TTL window
+    """
+    global _cached_result
+
+    cached = _cached_result
+    if cached is not None and time.monotonic() - cached[0] < READYZ_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    async with _get_cache_lock():
+        # Another probe may have refreshed the verdict while we waited
+        cached = _cached_result
+        if cached is not None and time.monotonic() - cached[0] < READYZ_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        result = await _check_readiness()
+        _cached_result = (time.monotonic(), result)
+        return result
+
+
 @router.get(
     "",  # endpoint set in router addition prefix
     summary="Readiness probe to verify service readiness.",
@@ -17,11 +80,7 @@ class ReadyzResult(BaseModel):
     responses={
         HTTP_500_INTERNAL_SERVER_ERROR: {"model": ReadyzResult},
     },
-    tags=["service-health"],
+    tags=[tags.READYZ.name],
 )
-def get_readyz() -> ReadyzResult:
-    #  TODO: Add more detailed readiness check
-    # Check for all dependent services health, database connections, etc.
-
-    ready_probe = ReadyzResult(message="OK")
-    return ready_probe
+async def get_readyz():
+    return await _cached_check()
@@ -7,58 +7,31 @@ from api.internal_api.v1alpha1 import sop as internal_sop
 from api import healthz, readyz, tags
 
 
-def ui_routers(app: FastAPI):
-    app.include_router(
-        ui_abend.router,
-        prefix="/adr/ui/v1alpha1/abend",
-    )
-    app.include_router(
-        ui_sop.router,
-        prefix="/adr/ui/v1alpha1/sop",
-    )
+# (router, prefix) pairs for each group of endpoints
+_UI_ROUTES = (
+    (ui_abend.router, "/adr/ui/v1alpha1/abend"),
+    (ui_sop.router, "/adr/ui/v1alpha1/sop"),
+)
 
-def internal_routers(app: FastAPI):
-    app.include_router(
-        internal_abend.router,
-        prefix="/adr/internal/v1alpha1/abend",
-    )
-    app.include_router(
-        internal_sop.router,
-        prefix="/adr/internal/v1alpha1/sop",
-    )
-    # Include health and readiness checks
-    app.include_router(
-        healthz.router,
-        prefix="/healthz",
-    )
-    app.include_router(
-        readyz.router,
-        prefix="/readyz",
-    )
+_INTERNAL_ROUTES = (
+    (internal_abend.router, "/adr/internal/v1alpha1/abend"),
+    (internal_sop.router, "/adr/internal/v1alpha1/sop"),
+)
 
+# Health and readiness checks
+_SYSTEM_ROUTES = (
+    (healthz.router, "/healthz"),
+    (readyz.router, "/readyz"),
+)
+
+# Routes to mount per API mode, each router listed exactly once.
+# Any mode not listed here mounts every route.
+_ROUTE_TABLE = {
+    tags.ApiType.UI: _UI_ROUTES,
+    tags.ApiType.INTERNAL: _INTERNAL_ROUTES + _SYSTEM_ROUTES,
+}
+_ALL_ROUTES = _UI_ROUTES + _INTERNAL_ROUTES + _SYSTEM_ROUTES
 
-# ROUTE_VISIBILITY: Dict[str, List[Any]] = {
-#     tags.ApiType.UI.value: [
-#         tags.UI_ABEND_V1ALPHA1,
-#         tags.UI_SOP_V1ALPHA1
-#     ],
-#     tags.ApiType.INTERNAL.value: [
-#         tags.INTERNAL_ABEND_V1ALPHA1,
-#         tags.INTERNAL_SOP_V1ALPHA1
-#     ],
-#     tags.ApiType.SYSTEM.value: [
-#         tags.HEALTHZ,
-#         tags.READYZ
-#     ],
-#     tags.ApiType.ALL.value: [
-#         tags.HEALTHZ,
-#         tags.READYZ,
-#         tags.UI_ABEND_V1ALPHA1,
-#         tags.UI_SOP_V1ALPHA1,
-#         tags.INTERNAL_ABEND_V1ALPHA1,
-#         tags.INTERNAL_SOP_V1ALPHA1
-#     ]
-# }
 
 def initialize_api_routes(app: FastAPI, api_mode: str = "all"):
     """
@@ -67,10 +40,5 @@ def initialize_api_routes(app: FastAPI, api_mode: str = "all"):
     :param app: FastAPI application instance
     :param api_mode: Mode of API to include routes for (default is "all")
     """
-    if api_mode == tags.ApiType.UI.value:
-        ui_routers(app)
-    elif api_mode == tags.ApiType.INTERNAL.value:
-        internal_routers(app)
-    else:
-        ui_routers(app)
-        internal_routers(app)
\ No newline at end of file
+    for router, prefix in _ROUTE_TABLE.get(api_mode, _ALL_ROUTES):
+        app.include_router(router, prefix=prefix)
@@ -1,29 +1,33 @@
-from enum import Enum
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from typing import Callable, Dict, Final, Hashable, List, Optional, Tuple
+from dataclasses import dataclass, field
 
 
-class ApiType(str, Enum):
+class ApiType:
     """
-    Enum defining the different API types available in the system.
+    Constants defining the different API types available in the system.
     This helps in categorizing APIs based on their target consumers.
+
+    Plain ``str`` class attributes rather than an ``Enum``: they are only ever
+    compared for equality, and plain attribute access avoids Enum's overhead.
     """
     UI = "ui"
     INTERNAL = "internal"
     SYSTEM = "system"  # For system endpoints like healthz, readyz
     ALL = "all"  # For APIs that are accessible to all types of consumers
 
+    _VALUES = (UI, INTERNAL, SYSTEM, ALL)
+
     @classmethod
-    def values(cls) -> List[str]:
+    def values(cls) -> Tuple[str, ...]:
         """
-        Returns a list of all enum values.
+        Returns all API type values.
         """
-        return [member.value for member in cls]
+        return cls._VALUES
 
 
-class ApiVersion(str, Enum):
+class ApiVersion:
     """
-    Enum defining the API versions.
+    Constants defining the API versions.
     This allows for versioning of APIs and supporting multiple versions simultaneously.
     """
     V1ALPHA1 = "v1alpha1"
@@ -31,15 +35,17 @@ class ApiVersion(str, Enum):
     # V1BETA1 = "v1beta1"
     # V1 = "v1"
 
+    _VALUES = (V1ALPHA1,)
+
     @classmethod
-    def values(cls) -> List[str]:
+    def values(cls) -> Tuple[str, ...]:
         """
-        Returns a list of all enum values.
+        Returns all API version values.
         """
-        return [member.value for member in cls]
+        return cls._VALUES
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Tag:
     """
     Class to represent an API tag with metadata.
@@ -47,19 +53,18 @@ class Tag:
     """
     name: str
     description: str
-    api_type: ApiType
-    api_version: Optional[ApiVersion] = None
-    display_name: str = ""
-
-    def __post_init__(self):
-        if not self.display_name:
-            self.display_name = self.name.title()
+    api_type: str
+    api_version: Optional[str] = None
+    # Keyword-only so it stays required without shifting positional arguments
+    display_name: str = field(kw_only=True)
 
     def as_dict(self) -> Dict[str, str]:
         """
         Return the tag as a dictionary for FastAPI's OpenAPI specification.
+        ``x-displayName`` is only read by ReDoc (/redoc); Swagger UI (/docs)
+        ignores it and shows ``name`` with the description as section headings.
         """
-        return {"name": self.name, "description": self.description}
+        return {"name": self.name, "description": self.description, "x-displayName": self.display_name}
 
 
 # System level tags
@@ -67,12 +72,14 @@ HEALTHZ = Tag(
     name="healthz",
     description="Health check endpoints to verify service liveness",
     api_type=ApiType.SYSTEM,
+    display_name="Healthz",
 )
 
 READYZ = Tag(
     name="readyz",
     description="Readiness probe endpoints to verify service is ready to receive requests",
     api_type=ApiType.SYSTEM,
+    display_name="Readyz",
 )
 
 # Internal API tags with version v1alpha1
@@ -110,43 +117,66 @@ UI_SOP_V1ALPHA1 = Tag(
 )
 
 
-# Add all tags to this list for easy access
-ALL_TAGS = [
+# Add all tags to this tuple for easy access
+ALL_TAGS: Final[Tuple[Tag, ...]] = (
     HEALTHZ,
     READYZ,
     INTERNAL_ABEND_V1ALPHA1,
     INTERNAL_SOP_V1ALPHA1,
     UI_ABEND_V1ALPHA1,
-    UI_SOP_V1ALPHA1
-]
+    UI_SOP_V1ALPHA1,
+)
+
+
+def _index_tags(key: Callable[[Tag], Hashable]) -> Dict[Hashable, Tuple[Tag, ...]]:
+    """
+    Group ALL_TAGS by the given key in a single pass.
+    """
+    index: Dict[Hashable, List[Tag]] = {}
+    for tag in ALL_TAGS:
+        index.setdefault(key(tag), []).append(tag)
+    return {k: tuple(v) for k, v in index.items()}
+
+
+# ALL_TAGS is fixed at import, so the lookups below are precomputed once
+# and the helpers hand out the shared tuples.
+_BY_TYPE: Final = _index_tags(lambda tag: tag.api_type)
+_BY_VERSION: Final = _index_tags(lambda tag: tag.api_version)
+_BY_TYPE_AND_VERSION: Final = _index_tags(lambda tag: (tag.api_type, tag.api_version))
+_NAMES_BY_TYPE: Final = {
+    api_type: tuple(tag.name for tag in type_tags)
+    for api_type, type_tags in _BY_TYPE.items()
+}
+_OPENAPI_TAG_DICTS: Final = tuple(tag.as_dict() for tag in ALL_TAGS)
+
 
 # Helper functions for getting tags by type, version, etc.
-def get_tags_by_type(api_type: ApiType) -> List[Tag]:
+def get_tags_by_type(api_type: str) -> Tuple[Tag, ...]:
     """
     Get all tags of a specific API type.
     """
-    return [tag for tag in ALL_TAGS if tag.api_type == api_type]
+    return _BY_TYPE.get(api_type, ())
 
-def get_tags_by_version(api_version: ApiVersion) -> List[Tag]:
+def get_tags_by_version(api_version: str) -> Tuple[Tag, ...]:
     """
     Get all tags of a specific API version.
     """
-    return [tag for tag in ALL_TAGS if tag.api_version == api_version]
+    return _BY_VERSION.get(api_version, ())
 
-def get_tags_by_type_and_version(api_type: ApiType, api_version: ApiVersion) -> List[Tag]:
+def get_tags_by_type_and_version(api_type: str, api_version: str) -> Tuple[Tag, ...]:
     """
     Get all tags of a specific API type and version.
     """
-    return [tag for tag in ALL_TAGS if tag.api_type == api_type and tag.api_version == api_version]
+    return _BY_TYPE_AND_VERSION.get((api_type, api_version), ())
 
-def get_tag_names_by_type(api_type: ApiType) -> List[str]:
+def get_tag_names_by_type(api_type: str) -> Tuple[str, ...]:
     """
     Get all tag names of a specific API type.
     """
-    return [tag.name for tag in get_tags_by_type(api_type)]
+    return _NAMES_BY_TYPE.get(api_type, ())
 
-def get_tag_dicts_for_openapi() -> List[Dict[str, str]]:
+def get_tag_dicts_for_openapi() -> Tuple[Dict[str, str], ...]:
     """
     Get all tags formatted as dictionaries for FastAPI's OpenAPI specification.
     """
-    return [tag.as_dict() for tag in ALL_TAGS]
+    return _OPENAPI_TAG_DICTS
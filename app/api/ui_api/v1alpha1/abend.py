@@ -1,13 +1,28 @@
-from fastapi import APIRouter, HTTPException, Path
+from fastapi import APIRouter, HTTPException, Path, Response
 from starlette import status
-from models.generic_responses import Message
+from models.generic_responses import NOT_FOUND_RESPONSES
 from models.abend import AbendDetail
 from api import tags
 
 # Create the router
 router = APIRouter()
 
+# This is just example data, built once so lookups skip model validation
+_FIXTURES: dict[str, AbendDetail] = {
+    "1": AbendDetail(
+        abendId="1",
+        name="ABEND-001",
+        severity="HIGH",
+        description="Example ABEND record 1",
+    ),
+}
 
+# Pre-rendered bodies; FastAPI returns Response objects as-is, skipping
+# response_model validation and re-encoding on every hit
+_FIXTURE_RESPONSES: dict[str, Response] = {
+    abend_id: Response(content=item.model_dump_json(by_alias=True), media_type="application/json")
+    for abend_id, item in _FIXTURES.items()
+}
 
 
 @router.get(
@@ -15,23 +30,17 @@ router = APIRouter()
     summary="Get ABEND details for UI",
     description="Get detailed information about a specific ABEND record for UI display.",
     response_model=AbendDetail,
-    responses={status.HTTP_404_NOT_FOUND: {"model": Message}},
-    tags=[tags.UI_ABEND_V1ALPHA1.display_name]  
+    responses=NOT_FOUND_RESPONSES,
+    tags=[tags.UI_ABEND_V1ALPHA1.name]  
 )
-async def get_abend(abend_id: str = Path(..., description="The unique identifier of the ABEND record to retrieve")) -> AbendDetail:
+async def get_abend(abend_id: str = Path(..., description="The unique identifier of the ABEND record to retrieve")):
     """
     Get detailed ABEND information for UI display
     """
-    # This is just example data
-    if abend_id == "1":
-        return AbendDetail(
-            abendId="1", 
-            name="ABEND-001", 
-            severity="HIGH",
-            description="Example ABEND record 1",
-        )
-    else:
+    response = _FIXTURE_RESPONSES.get(abend_id)
+    if response is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ABEND record with ID {abend_id} not found",
         )
+    return response
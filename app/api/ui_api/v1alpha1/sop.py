@@ -1,5 +1,5 @@
 from fastapi import APIRouter, HTTPException
-from models.generic_responses import Message
+from models.generic_responses import NOT_FOUND_RESPONSES
 from models.sop import SOPDetail
 from api import tags
 from starlette import status
@@ -14,8 +14,8 @@ router = APIRouter()
     summary="Get SOP details for UI",
     description="Get detailed information about a specific SOP for UI display.",
     response_model=SOPDetail,
-    responses={status.HTTP_404_NOT_FOUND: {"model": Message}},
-    tags=[tags.UI_SOP_V1ALPHA1.display_name]
+    responses=NOT_FOUND_RESPONSES,
+    tags=[tags.UI_SOP_V1ALPHA1.name]
 )
 async def get_sop_for_ui(sop_id: str):
     """
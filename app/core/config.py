@@ -9,49 +9,34 @@ class Settings:
     APP_NAME: str = "adr"
     APP_SERVICE_NAME: str = "adr-svc"
 
+    __slots__ = (
+        "is_dev_env",
+        "log_level",
+        "port",
+        "graph_api_endpoint",
+        "tenant_id",
+        "client_id",
+        "client_secret",
+        "graph_api_scopes",
+    )
+
     def __init__(self):
-        pass
-    
-    @property
-    def is_dev_env(self):
-        pod_namespace = os.environ.get("POD_NAMESPACE")
-        
-        return bool(pod_namespace)
-    
-    @property
-    def log_level(self):
-        if self.is_dev_env:
-            return "DEBUG"
-        return "INFO"
+        # Environment is read once here; later reads are plain attribute loads
+        env = os.environ
+
+        self.is_dev_env = bool(env.get("POD_NAMESPACE"))
+        self.log_level = "DEBUG" if self.is_dev_env else "INFO"
+        self.port = 8000
+
+        # Graph API Configuration
+        self.graph_api_endpoint = env.get("GRAPH_API_ENDPOINT", "https://graph.microsoft.com/v1.0")
+        self.tenant_id = env.get("GRAPH_API_TENANT_ID")
+        self.client_id = env.get("GRAPH_API_CLIENT_ID")
+        self.client_secret = env.get("GRAPH_API_CLIENT_SECRET")
 
-    @property
-    def port(self):
-        return 8000
-    
-    # Graph API Configuration
-    @property
-    def graph_api_endpoint(self):
-        return os.environ.get("GRAPH_API_ENDPOINT", "https://graph.microsoft.com/v1.0")
-    
-    @property
-    def tenant_id(self):
-        return os.environ.get("GRAPH_API_TENANT_ID")
-    
-    @property
-    def client_id(self):
-        return os.environ.get("GRAPH_API_CLIENT_ID")
-    
-    @property
-    def client_secret(self):
-        return os.environ.get("GRAPH_API_CLIENT_SECRET")
-    
-    @property
-    def graph_api_scopes(self):
         default_scopes = ["https://graph.microsoft.com/.default"]
-        scopes_env = os.environ.get("GRAPH_API_GRAPH_API_SCOPES")
-        if scopes_env:
-            return scopes_env.split(",")
-        return default_scopes
+        scopes_env = env.get("GRAPH_API_GRAPH_API_SCOPES")
+        self.graph_api_scopes = scopes_env.split(",") if scopes_env else default_scopes
 
 
 try:
@@ -5,16 +5,62 @@ This module provides reusable functions to interact with Microsoft Graph API
 for email-related operations like sending emails, reading messages, etc.
 """
 
-from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+import asyncio
+import time
+from typing import Optional, List, Dict, Any, Mapping, Tuple
 
 import httpx
+import orjson
 from structlog import get_logger
 
 from .config import settings
 
 logger = get_logger()
 
+# HTTP methods whose Graph API requests carry a JSON body
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Microsoft Graph accepts at most 20 sub-requests per JSON batch
+_GRAPH_BATCH_LIMIT = 20
+
+# Sizes both the httpx connection pool and the in-flight request gate
+_MAX_CONCURRENT_REQUESTS = 64
+
+# Throttling responses that are retried with back-off. 429 means Graph did not
+# process the request; 503 may come after it did, so only idempotent methods
+# retry it (a repeated POST me/sendMail would send the email twice).
+_RETRY_STATUSES = frozenset({429, 503})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+_MAX_RETRIES = 3
+_BACKOFF_BASE_SECONDS = 1.0
+_BACKOFF_MAX_SECONDS = 30.0
+
+
+def _format_recipients(emails: List[str]) -> List[Dict[str, Any]]:
+    """Format email addresses as Graph API recipient objects."""
+    return [{"emailAddress": {"address": email}} for email in emails]
+
+
+def _retry_delay(headers: Mapping[str, str], attempt: int) -> float:
+    """Seconds to wait before retrying a throttled response, preferring Graph's Retry-After."""
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            delay = -1.0
+        # Comparison also rejects NaN; "inf" and oversized values are clamped
+        if delay >= 0.0:
+            return min(delay, _BACKOFF_MAX_SECONDS)
+    return min(_BACKOFF_BASE_SECONDS * 2 ** attempt, _BACKOFF_MAX_SECONDS)
+
+
+def _should_retry(method: str, status_code: int) -> bool:
+    """Whether a throttled response can safely be retried for this method."""
+    if status_code == 429:
+        return True
+    return status_code in _RETRY_STATUSES and method in _IDEMPOTENT_METHODS
+
 
 class GraphAPIError(Exception):
     """Custom exception for Graph API errors."""
@@ -24,93 +70,173 @@ class GraphAPIError(Exception):
 class GraphAPIClient:
     """Microsoft Graph API client for email operations."""
     
+    _BASE_HEADERS = {"Content-Type": "application/json"}
+    
     def __init__(self):
         self.base_url = settings.graph_api_endpoint
         self.tenant_id = settings.tenant_id
         self.client_id = settings.client_id
         self.client_secret = settings.client_secret
         self.scopes = settings.graph_api_scopes
-        self._access_token = None
-        self._token_expires_at = None
-    
-    async def _get_access_token(self) -> str:
-        """Get access token using client credentials flow."""
-        if self._access_token and self._token_expires_at and datetime.now() < self._token_expires_at:
-            return self._access_token
-        
-        if not all([self.tenant_id, self.client_id, self.client_secret]):
-            raise GraphAPIError("Missing required Graph API credentials. Check environment variables.")
-        
-        token_url = f"https://login.microsoftonline.com/{self.tenant_id}/oauth2/v2.0/token"
-        
-        data: Dict[str, str] = {
+        # Token request parts only depend on configuration, so build them once
+        self._has_credentials = all([self.tenant_id, self.client_id, self.client_secret])
+        self._token_url = f"https://login.microsoftonline.com/{self.tenant_id}/oauth2/v2.0/token"
+        self._token_payload: Dict[str, str] = {
             "client_id": str(self.client_id),
             "client_secret": str(self.client_secret),
             "scope": " ".join(self.scopes),
             "grant_type": "client_credentials"
         }
+        self._access_token = None
+        self._token_deadline = 0.0  # time.monotonic() value after which the token is stale
+        self._http: Optional[httpx.AsyncClient] = None
+        self._token_lock: Optional[asyncio.Lock] = None
+        self._gate: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def __aenter__(self) -> "GraphAPIClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    def _bind_loop(self) -> None:
+        """Drop loop-bound state when used from a different event loop than before."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            # Pooled connections, the token lock and the gate all belong to the
+            # previous loop (e.g. an earlier asyncio.run()), so rebuild them here.
+            self._http = None
+            self._token_lock = None
+            self._gate = None
+        self._loop = loop
+    
+    def _client(self) -> httpx.AsyncClient:
+        """Get the shared, connection-pooling HTTP client, creating it on first use."""
+        self._bind_loop()
+        if self._http is None or self._http.is_closed:
+            # HTTP/2 lets concurrent Graph calls multiplex over one connection
+            self._http = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=_MAX_CONCURRENT_REQUESTS,
+                    max_keepalive_connections=_MAX_CONCURRENT_REQUESTS // 2,
+                    keepalive_expiry=90.0,
+                ),
+            )
+        return self._http
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and release its pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    def _cached_access_token(self) -> Optional[str]:
+        """Return the cached access token if it has not expired yet."""
+        if self._access_token and time.monotonic() < self._token_deadline:
+            return self._access_token
+        return None
+    
+    async def _get_access_token(self) -> str:
+        """Get access token, letting a single coroutine refresh it at a time."""
+        self._bind_loop()
+        token = self._cached_access_token()
+        if token:
+            return token
+        
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        
+        async with self._token_lock:
+            # Another coroutine may have refreshed the token while we waited
+            token = self._cached_access_token()
+            if token:
+                return token
+            return await self._fetch_access_token()
+    
+    async def _fetch_access_token(self) -> str:
+        """Get access token using client credentials flow."""
+        if not self._has_credentials:
+            raise GraphAPIError("Missing required Graph API credentials. Check environment variables.")
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(token_url, data=data)
-                response.raise_for_status()
-                
-                token_data = response.json()
-                self._access_token = token_data["access_token"]
-                expires_in = token_data.get("expires_in", 3600)
-                self._token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)  # 1 minute buffer
-                
-                logger.info("Successfully obtained Graph API access token")
-                return self._access_token
-                
-            except httpx.HTTPStatusError as e:
-                logger.error("Failed to obtain access token", status_code=e.response.status_code, response=e.response.text)
-                raise GraphAPIError(f"Failed to obtain access token: {e.response.status_code}")
-            except Exception as e:
-                logger.error("Error obtaining access token", error=str(e))
-                raise GraphAPIError(f"Error obtaining access token: {str(e)}")
+        client = self._client()
+        try:
+            response = await client.post(self._token_url, data=self._token_payload)
+            response.raise_for_status()
+            
+            token_data = orjson.loads(response.content)
+            self._access_token = token_data["access_token"]
+            expires_in = token_data.get("expires_in", 3600)
+            self._token_deadline = time.monotonic() + expires_in - 60  # 1 minute buffer
+            
+            logger.info("Successfully obtained Graph API access token")
+            return self._access_token
+            
+        except httpx.HTTPStatusError as e:
+            logger.error("Failed to obtain access token", status_code=e.response.status_code, response=e.response.text)
+            raise GraphAPIError(f"Failed to obtain access token: {e.response.status_code}")
+        except Exception as e:
+            logger.error("Error obtaining access token", error=str(e))
+            raise GraphAPIError(f"Error obtaining access token: {str(e)}")
     
-    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    async def _make_request(self,
+                            method: str,
+                            endpoint: str,
+                            data: Optional[Dict[str, Any]] = None,
+                            params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make authenticated request to Graph API."""
         token = await self._get_access_token()
         
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
+        headers = {**self._BASE_HEADERS, "Authorization": f"Bearer {token}"}
         
         url = f"{self.base_url}/{endpoint}"
         
-        async with httpx.AsyncClient() as client:
-            try:
-                if method.upper() == "GET":
-                    response = await client.get(url, headers=headers)
-                elif method.upper() == "POST":
-                    response = await client.post(url, headers=headers, json=data)
-                elif method.upper() == "PUT":
-                    response = await client.put(url, headers=headers, json=data)
-                elif method.upper() == "DELETE":
-                    response = await client.delete(url, headers=headers)
-                else:
-                    raise GraphAPIError(f"Unsupported HTTP method: {method}")
-                
-                response.raise_for_status()
-                
-                if response.status_code == 204:  # No content
-                    return {}
+        method = method.upper()
+        content = orjson.dumps(data) if data is not None and method in _BODY_METHODS else None
+        
+        if self._gate is None:
+            self._gate = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        
+        client = self._client()
+        try:
+            for attempt in range(_MAX_RETRIES + 1):
+                async with self._gate:
+                    response = await client.request(method, url, headers=headers, content=content, params=params)
                 
-                return response.json()
+                if not _should_retry(method, response.status_code) or attempt == _MAX_RETRIES:
+                    break
                 
-            except httpx.HTTPStatusError as e:
-                logger.error("Graph API request failed", 
-                           method=method, 
-                           endpoint=endpoint, 
-                           status_code=e.response.status_code, 
-                           response=e.response.text)
-                raise GraphAPIError(f"Graph API request failed: {e.response.status_code} - {e.response.text}")
-            except Exception as e:
-                logger.error("Error making Graph API request", method=method, endpoint=endpoint, error=str(e))
-                raise GraphAPIError(f"Error making Graph API request: {str(e)}")
+                # Back off outside the gate so throttled requests don't hold a slot
+                delay = _retry_delay(response.headers, attempt)
+                logger.warning("Graph API request throttled, retrying",
+                               method=method,
+                               endpoint=endpoint,
+                               status_code=response.status_code,
+                               attempt=attempt + 1,
+                               delay=delay,
+                               rate_limit_remaining=response.headers.get("RateLimit-Remaining"))
+                await asyncio.sleep(delay)
+            
+            response.raise_for_status()
+            
+            if response.status_code == 204:  # No content
+                return {}
+            
+            return orjson.loads(response.content)
+            
+        except httpx.HTTPStatusError as e:
+            logger.error("Graph API request failed", 
+                       method=method, 
+                       endpoint=endpoint, 
+                       status_code=e.response.status_code, 
+                       response=e.response.text)
+            raise GraphAPIError(f"Graph API request failed: {e.response.status_code} - {e.response.text}")
+        except Exception as e:
+            logger.error("Error making Graph API request", method=method, endpoint=endpoint, error=str(e))
+            raise GraphAPIError(f"Error making Graph API request: {str(e)}")
     
     async def send_email(self, 
                         to_recipients: List[str],
@@ -135,9 +261,6 @@ class GraphAPIClient:
         Returns:
             Response from Graph API
         """
-        def format_recipients(emails: List[str]) -> List[Dict[str, Any]]:
-            return [{"emailAddress": {"address": email}} for email in emails]
-        
         message_data: Dict[str, Any] = {
             "message": {
                 "subject": subject,
@@ -145,15 +268,15 @@ class GraphAPIClient:
                     "contentType": body_type,
                     "content": body
                 },
-                "toRecipients": format_recipients(to_recipients)
+                "toRecipients": _format_recipients(to_recipients)
             }
         }
         
         if cc_recipients:
-            message_data["message"]["ccRecipients"] = format_recipients(cc_recipients)
+            message_data["message"]["ccRecipients"] = _format_recipients(cc_recipients)
         
         if bcc_recipients:
-            message_data["message"]["bccRecipients"] = format_recipients(bcc_recipients)
+            message_data["message"]["bccRecipients"] = _format_recipients(bcc_recipients)
         
         # Determine endpoint based on whether sender is specified
         if sender_email:
@@ -191,17 +314,14 @@ class GraphAPIClient:
         else:
             endpoint = f"me/mailFolders/{folder}/messages"
         
-        params = [f"$top={top}"]
+        params: Dict[str, Any] = {"$top": top}
         
         if filter_query:
-            params.append(f"$filter={filter_query}")
-        
-        if params:
-            endpoint += "?" + "&".join(params)
+            params["$filter"] = filter_query
         
         logger.info("Retrieving messages", user_email=user_email, folder=folder, top=top)
         
-        return await self._make_request("GET", endpoint)
+        return await self._make_request("GET", endpoint, params=params)
     
     async def get_message_by_id(self, 
                                message_id: str,
@@ -249,6 +369,72 @@ class GraphAPIClient:
         
         return await self._make_request("PATCH", endpoint, data)
     
+    async def batch_mark_read(self,
+                              message_ids: List[str],
+                              user_email: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Mark several messages as read using Graph JSON batching.
+        
+        Sends one $batch request per 20 messages instead of one request per message.
+        Sub-requests throttled inside a batch (429/503) are retried with back-off;
+        marking a message read is idempotent, so this is safe.
+        
+        Args:
+            message_ids: Message IDs
+            user_email: User email address (if not provided, uses application's default)
+        
+        Returns:
+            One sub-response per message, in input order. A batch succeeds even when
+            individual sub-requests fail, so callers must check each response's status.
+        """
+        prefix = f"/users/{user_email}" if user_email else "/me"
+        
+        logger.info("Marking messages as read in batch", count=len(message_ids), user_email=user_email)
+        
+        # Sub-request IDs are the message positions, so retries keep their slot
+        pending = [(str(index), message_id) for index, message_id in enumerate(message_ids)]
+        responses: Dict[str, Dict[str, Any]] = {}
+        for attempt in range(_MAX_RETRIES + 1):
+            throttled: List[Tuple[str, str]] = []
+            delay = 0.0
+            for start in range(0, len(pending), _GRAPH_BATCH_LIMIT):
+                chunk = pending[start:start + _GRAPH_BATCH_LIMIT]
+                batch: Dict[str, Any] = {
+                    "requests": [
+                        {
+                            "id": request_id,
+                            "method": "PATCH",
+                            "url": f"{prefix}/messages/{message_id}",
+                            "headers": {"Content-Type": "application/json"},
+                            "body": {"isRead": True},
+                        }
+                        for request_id, message_id in chunk
+                    ]
+                }
+                result = await self._make_request("POST", "$batch", batch)
+                
+                message_ids_by_request = dict(chunk)
+                for sub_response in result.get("responses", []):
+                    request_id = sub_response.get("id")
+                    responses[request_id] = sub_response
+                    if sub_response.get("status") in _RETRY_STATUSES:
+                        throttled.append((request_id, message_ids_by_request[request_id]))
+                        headers = httpx.Headers(sub_response.get("headers") or {})
+                        delay = max(delay, _retry_delay(headers, attempt))
+            
+            if not throttled or attempt == _MAX_RETRIES:
+                break
+            
+            logger.warning("Graph API batch sub-requests throttled, retrying",
+                           count=len(throttled),
+                           attempt=attempt + 1,
+                           delay=delay)
+            await asyncio.sleep(delay)
+            pending = throttled
+        
+        ordered_ids = (str(index) for index in range(len(message_ids)))
+        return [responses[request_id] for request_id in ordered_ids if request_id in responses]
+    
     async def delete_message(self, 
                             message_id: str,
                             user_email: Optional[str] = None) -> Dict[str, Any]:
@@ -1,9 +1,25 @@
 import logging
 import sys
+import orjson
 import structlog
 from app.core.config import settings
 from structlog.contextvars import merge_contextvars
 
+def _orjson_dumps_str(obj, **kwargs) -> str:
+    # stdlib handlers expect str, while orjson returns bytes
+    return orjson.dumps(obj, **kwargs).decode()
+
+
+def _add_logger_name(logger, method_name, event_dict):
+    # BytesLogger has no name, so recover the calling module the way
+    # stdlib's LoggerFactory did and keep the "logger" field in app logs.
+    frame = sys._getframe(1)
+    while frame.f_back is not None and frame.f_globals.get("__name__", "").startswith("structlog"):
+        frame = frame.f_back
+    event_dict["logger"] = frame.f_globals.get("__name__", "?")
+    return event_dict
+
+
 def setup_logging():
     logging.basicConfig(
         format="%(message)s",
@@ -11,26 +27,28 @@ def setup_logging():
         level=settings.log_level,
     )
 
+    # Application logs bypass stdlib logging: orjson renders straight to bytes
+    # and BytesLogger writes them to stdout without a str encode step.
     structlog.configure(
         processors=[
             merge_contextvars, # This should be first
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
+            _add_logger_name,
+            structlog.processors.add_log_level,
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.TimeStamper(key="@timestamp", fmt="iso"),
             structlog.processors.UnicodeDecoder(),
-            structlog.stdlib.filter_by_level,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=orjson.dumps),
         ],
-        context_class=structlog.threadlocal.wrap_dict(dict),
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=structlog.BytesLoggerFactory(),
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelName(settings.log_level)
+        ),
         cache_logger_on_first_use=True,
     )
 
     formatter_with_context = structlog.stdlib.ProcessorFormatter(
-        processor=structlog.processors.JSONRenderer(),
+        processor=structlog.processors.JSONRenderer(serializer=_orjson_dumps_str),
         foreign_pre_chain=[
             merge_contextvars, # This should be first
             structlog.stdlib.add_logger_name,
@@ -1,19 +1,33 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from app.api import route_management
 import uvicorn
 from core.config import settings
 import argparse
 from app.api import tags
 from app.core.logger import struct_logger
+from app.core.graphapi import graph_client
 from structlog import get_logger
 
 
 struct_logger.setup_logging()
 logger = get_logger()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release shared outbound resources when the application shuts down"""
+    yield
+    await graph_client.aclose()
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application"""
-    app = FastAPI()
+    app = FastAPI(
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+        openapi_tags=list(tags.get_tag_dicts_for_openapi()),
+    )
     # TODO: Add Middlewares
     return app
 
@@ -33,4 +47,4 @@ if __name__ == "__main__":
 
 elif __name__ == "main":
     logger.info("Initializing ALL routes")
-    route_management.initialize_api_routes(app, tags.ApiType.ALL.value)
\ No newline at end of file
+    route_management.initialize_api_routes(app, tags.ApiType.ALL)
\ No newline at end of file
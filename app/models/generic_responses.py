@@ -1,5 +1,10 @@
 from pydantic import BaseModel, Field
+from starlette.status import HTTP_404_NOT_FOUND
 
 
 class Message(BaseModel):
     message: str = Field(..., title="Message", description="Message")
+
+
+# Shared OpenAPI ``responses=`` metadata for routes that can return 404
+NOT_FOUND_RESPONSES = {HTTP_404_NOT_FOUND: {"model": Message}}
@@ -26,16 +26,15 @@ async def example_send_email():
 async def example_send_email_with_cc():
     """Example of sending an email with CC recipients."""
     try:
-        # Create a client instance
-        client = GraphAPIClient()
-        
-        result = await client.send_email(
-            to_recipients=["primary@example.com"],
-            cc_recipients=["cc1@example.com", "cc2@example.com"],
-            subject="Project Update",
-            body="Please find the project update attached.",
-            body_type="Text"
-        )
+        # Create a client instance; the context manager closes its connection pool
+        async with GraphAPIClient() as client:
+            result = await client.send_email(
+                to_recipients=["primary@example.com"],
+                cc_recipients=["cc1@example.com", "cc2@example.com"],
+                subject="Project Update",
+                body="Please find the project update attached.",
+                body_type="Text"
+            )
         print("Email with CC sent successfully!")
         return result
     except Exception as e:
@@ -64,10 +63,9 @@ async def example_get_messages():
 async def example_get_user_profile():
     """Example of getting user profile information."""
     try:
-        # Create a client instance
-        client = GraphAPIClient()
-        
-        profile = await client.get_user_profile()
+        # Create a client instance; the context manager closes its connection pool
+        async with GraphAPIClient() as client:
+            profile = await client.get_user_profile()
         
         print(f"User: {profile.get('displayName')}")
         print(f"Email: {profile.get('mail') or profile.get('userPrincipalName')}")
@@ -87,11 +85,10 @@ async def example_mark_message_as_read():
         if messages.get('value'):
             message_id = messages['value'][0]['id']
             
-            # Create a client instance
-            client = GraphAPIClient()
-            
-            # Mark the first message as read
-            await client.mark_message_as_read(message_id)
+            # Create a client instance; the context manager closes its connection pool
+            async with GraphAPIClient() as client:
+                # Mark the first message as read
+                await client.mark_message_as_read(message_id)
             print(f"Message {message_id} marked as read")
         else:
             print("No messages found to mark as read")